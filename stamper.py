@@ -1,13 +1,21 @@
-from ffmpeg_progress_yield import FfmpegProgress
 from datetime import datetime, timedelta
-from typing import Any
+from functools import lru_cache, cache
+from typing import Any, Callable, Coroutine, Iterable, Iterator
 import subprocess
 import argparse
-import json
+import shutil
+import orjson
 import sys
 import re
 import os
 
+try:
+    # parsed as naive local time, same as the strptime fallback
+    from ciso8601 import parse_datetime_as_naive
+except ImportError:
+    def parse_datetime_as_naive(datetime_string: str) -> datetime:
+        return datetime.strptime(datetime_string, "%Y-%m-%dT%H:%M:%S.%fZ")
+
 if sys.platform == 'win32':
     si = subprocess.STARTUPINFO()
     si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
@@ -15,20 +23,27 @@ if sys.platform == 'win32':
 else:
     sp_flags = {}
 
-prefix_re = r'[a-zA-Z0-9_-]'
+prefix_re = re.compile(r'[a-zA-Z0-9_-]')
+ext_re = re.compile(r'\.(\w+)$')
+# drawtext values are unescaped twice, by the filtergraph and then by the option parser
+escape_table = str.maketrans({':': r'\\:', '"': r'\\"', '\\': r'\\\\'})
 nl = '\n'
 
-def probe(filename: str) -> dict:
-    cmd = ['ffprobe', '-v', 'quiet', '-print_format', 'json', '-show_format', '-show_streams', filename]
-    return json.loads(subprocess.check_output(cmd, **sp_flags).decode())
+@lru_cache(maxsize=256)
+def _probe(filename: str, mtime: float) -> dict:
+    cmd = ['ffprobe', '-v', 'quiet', '-print_format', 'json',
+           '-show_entries', 'format=duration:stream=codec_type,codec_name,width,height:stream_tags=creation_time', filename]
+    return orjson.loads(subprocess.check_output(cmd, **sp_flags))
 
-def ensure_ffmpeg():
-    try:
-        subprocess.run(['ffmpeg', '-version'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **sp_flags)
-        subprocess.run(['ffprobe', '-version'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **sp_flags)
+def probe(filename: str, st: os.stat_result | None = None) -> dict:
+    # mtime is part of the cache key so modified files get probed again
+    return _probe(filename, (st or os.stat(filename)).st_mtime)
 
+@cache
+def ensure_ffmpeg():
+    if shutil.which('ffmpeg') and shutil.which('ffprobe'):
         return True
-    except FileNotFoundError:
+    else:
         print('Error: ffmpeg not found')
         
         if sys.platform == 'win32':
@@ -42,25 +57,59 @@ def ensure_ffmpeg():
 
         return False
 
+@cache
+def resolve_font(font: str) -> str | None:
+    if '.' in font:
+        return font
+
+    if sys.platform == 'win32':
+        import winreg
+        keys = [
+            (winreg.HKEY_LOCAL_MACHINE, os.path.join(os.environ.get('WINDIR', 'C:/Windows'), 'Fonts')),
+            (winreg.HKEY_CURRENT_USER, os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Microsoft/Windows/Fonts')),
+        ]
+        for root, folder in keys:
+            try:
+                with winreg.OpenKey(root, r'SOFTWARE\Microsoft\Windows NT\CurrentVersion\Fonts') as key:
+                    for i in range(winreg.QueryInfoKey(key)[1]):
+                        # e.g. "Arial (TrueType)" or "Cambria & Cambria Math (TrueType)"
+                        name, file, _ = winreg.EnumValue(key, i)
+                        if font.lower() in name.split(' (')[0].lower().split(' & '):
+                            return os.path.join(folder, file)
+            except OSError:
+                continue
+        return None
+
+    try:
+        return subprocess.check_output(['fc-match', '-f', '%{file}', font], **sp_flags).decode() or None
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
 def file_name(file: str) -> str:
-    return file.split('/')[-1]
+    return os.path.basename(file)
     
 def escape(value: str) -> str:
-    return value.replace(':', '\\:').replace('"', '\\"').replace('\\', '\\\\')
+    return value.translate(escape_table)
 
-def process(filename: str, suffix:str, size:float, margin:float, position_x:str, position_y:str, font:str, color:str, border:str, opacity:float, gpu=False, quality=14) -> list[str] | None:
+def ffmpeg_args(filename: str, index: int, suffix:str, size:float, margin:float, position_x:str, position_y:str, font:str, color:str, border:str, opacity:float, gpu=False, quality=14, preset: str | None = None, threads=0) -> tuple[list[str], list[str]] | None:
     try:
-        info = probe(filename)
+        st = os.stat(filename)
+        info = probe(filename, st)
         stream = next(filter(lambda s: s['codec_type'] == 'video', info['streams']))
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, OSError):
         print(f'Error: invalid input file {filename}')
         return
 
+    output = ext_re.sub(fr'{suffix}.\1', filename)
+    if opacity <= 0:
+        # invisible overlay, just copy the streams
+        return ['-i', filename], ['-map', f'{index}:v:0', '-map', f'{index}:a?', '-c', 'copy', output]
+
     try:
-        creation_time = datetime.strptime(stream['tags']['creation_time'], "%Y-%m-%dT%H:%M:%S.%fZ").timestamp()
+        creation_time = parse_datetime_as_naive(stream['tags']['creation_time']).timestamp()
     except KeyError:
         print(f'Warning: no creation time for {filename}, using file creation time')
-        creation_time = os.path.getctime(filename)
+        creation_time = st.st_ctime
     
     width = stream['width']
     height = stream['height']
@@ -80,7 +129,6 @@ def process(filename: str, suffix:str, size:float, margin:float, position_x:str,
 
     codec = stream['codec_name']
     qp = min((101 - quality) // (2 if gpu else 1.7), 51)
-    output = re.sub(r'\.(\w+)$', fr'{suffix}.\1', filename)
 
     input_flags = [
         '-hwaccel', 'cuda', 
@@ -90,72 +138,193 @@ def process(filename: str, suffix:str, size:float, margin:float, position_x:str,
     
     output_flags = [
         '-c:v', f'{codec}_nvenc',
-        ] if gpu else []
+        '-preset', preset or 'p4',
+        '-tune', 'hq',
+        '-rc', 'vbr',
+        '-cq', str(qp),
+        '-b:v', '0',
+        ] if gpu else [
+        '-c:v', 'libx264',
+        '-preset', preset or 'ultrafast',
+        '-tune', 'zerolatency',
+        '-qp', str(qp),
+        ]
+    if threads:
+        output_flags += ['-threads', str(threads)]
     
+    fontfile = resolve_font(font)
     drawtext = {
-        'alpha': opacity/100,
-        # TODO: Fix font path for Windows (detect fontconfig)
-        ('fontfile' if '.' in font else 'font'): font.replace('\\', '/'),
+        'alpha': f'{opacity/100:.4g}',
+        ('fontfile' if fontfile else 'font'): (fontfile or font).replace('\\', '/'),
         'fontcolor': color,
-        'fontsize': scaled_size,
+        'fontsize': f'{scaled_size:.4g}',
         'bordercolor': border,
-        'borderw': scaled_size/16,
+        'borderw': f'{scaled_size/16:.4g}',
         'x': x,
         'y': y,
         'text': fr'%{{pts:localtime:{int(creation_time)}}}',
     }
 
-    return ['ffmpeg', '-y', '-hide_banner',
-            *input_flags, '-i', filename,
-            '-c:a', 'copy',
-            '-qp', str(qp),
-            '-vf', f'drawtext="{":".join(f"{escape(k)}={escape(str(v))}" for k, v in drawtext.items())}',
-            *output_flags, output]
-
-def handle_cli(input_files: list[str], verbose=True, **kwargs):
+    # keys are plain option names, only the values need escaping
+    options = [f'{k}={escape(str(v))}' for k, v in drawtext.items()]
+    vf = 'drawtext="' + ':'.join(options)
+
+    input_flags += ['-i', filename]
+    output_args = ['-map', f'{index}:v:0', '-map', f'{index}:a?', '-c:a', 'copy', '-vf', vf]
+    output_args += output_flags
+    output_args.append(output)
+    return input_flags, output_args
+
+def process(filename: str, **kwargs) -> list[str] | None:
+    return process_batch([filename], **kwargs)
+
+def process_batch(filenames: list[str], **kwargs) -> list[str] | None:
+    # one ffmpeg with an input and an output per file, only the process and the CUDA device
+    # are shared, every input still gets its own decoder and every output its own NVENC session
+    cmd = ['ffmpeg', '-y', '-hide_banner', '-progress', 'pipe:1', '-nostats']
+    outputs = []
+    for filename in filenames:
+        if args := ffmpeg_args(filename, len(outputs), **kwargs):
+            cmd += args[0]
+            outputs.append(args[1])
+
+    if outputs:
+        for output in outputs:
+            cmd += output
+        return cmd
+
+def duration(filenames: list[str]) -> float:
+    # outputs of a batch are encoded side by side, so the longest one sets the pace
+    durations = []
+    for filename in filenames:
+        try:
+            durations.append(float(probe(filename)['format']['duration']))
+        except (subprocess.CalledProcessError, OSError, KeyError, ValueError):
+            pass
+    return max(durations, default=0)
+
+def parse_progress(line: str, time: int, total: float) -> tuple[int, float | None]:
+    # -progress output comes in key=value blocks, each one closed by a progress= line;
+    # returns the latest out_time and, at the end of a block, the percentage done
+    key, _, value = line.rstrip().partition('=')
+    if key == 'out_time_us' and value.isdigit():
+        return int(value), None
+    if key == 'progress':
+        # the last timestamp is usually a frame short of the duration
+        if value == 'end':
+            return time, 100
+        return time, min(time / total / 1e4, 100) if total else 0
+    return time, None
+
+def read_progress(lines: Iterable[str], total: float, log: Callable[[str], None] | None = None) -> Iterator[float]:
+    time = 0
+    for line in lines:
+        key, sep, _ = line.partition('=')
+        if not (sep and key.isidentifier()):
+            if log:
+                log(line.rstrip())
+            continue
+
+        time, progress = parse_progress(line, time, total)
+        if progress is not None:
+            yield progress
+
+def batches(files: list[str], size: int) -> list[list[str]]:
+    # clips of one recording share the name up to the last underscore (video_1.mp4, video_2.mp4)
+    groups: dict[str, list[str]] = {}
+    for file in files:
+        groups.setdefault(os.path.splitext(file)[0].rsplit('_', 1)[0], []).append(file)
+    return [group[i:i + size] for group in groups.values() for i in range(0, len(group), size)]
+
+def handle_cli(input_files: list[str], verbose=True, jobs: int | None = None, batch=1, **kwargs):
     if not ensure_ffmpeg():
         exit(1)
 
+    from concurrent.futures import ThreadPoolExecutor
+    from queue import Queue
     if not verbose:
         from tqdm import tqdm
 
-    for filename in input_files:
-        if cmd := process(filename, **kwargs):
+    # --jobs caps the outputs encoded at once, batched or not; NVENC sessions
+    # are limited on consumer GPUs, so only fan out CPU encodes by default
+    cpus = os.cpu_count() or 1
+    limit = jobs or (1 if kwargs.get('gpu') else cpus)
+    groups = batches(input_files, min(max(batch, 1), limit))
+    size = max(map(len, groups))
+    jobs = min(len(groups), max(limit // size, 1))
+    threads = max(cpus // (jobs * size), 1)
+
+    # progress bars reuse the screen rows of finished jobs
+    slots: Queue[int] = Queue()
+    for slot in range(jobs):
+        slots.put(slot)
+
+    def run_one(filenames: list[str]):
+        position = slots.get()
+        try:
+            encode(position, filenames)
+        finally:
+            slots.put(position)
+
+    def encode(position: int, filenames: list[str]):
+        if cmd := process_batch(filenames, threads=threads, **kwargs):
+            desc = file_name(filenames[0]) + (f' (+{len(filenames) - 1})' if len(filenames) > 1 else '')
+            total = duration(filenames)
             if verbose:
-                print(f'Processing {filename}')
-                subprocess.run(cmd)
-            else:
-                ff = FfmpegProgress(cmd)
-                with tqdm(total=100, position=0, desc=file_name(filename)) as pbar: # type: ignore
-                    for progress in ff.run_command_with_progress(popen_kwargs=sp_flags):
-                        pbar.update(progress - pbar.n)
+                print(f'Processing {", ".join(filenames)}')
+
+            # stdin is detached so parallel jobs don't fight over the terminal,
+            # in verbose mode the log is merged into the progress pipe
+            stderr = subprocess.STDOUT if verbose else subprocess.DEVNULL
+            with subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=stderr, bufsize=1, encoding='utf-8', errors='replace', **sp_flags) as proc:
+                if verbose:
+                    for progress in read_progress(proc.stdout, total, lambda line: print(f'[{desc}] {line}')): # type: ignore
+                        print(f'[{desc}] {progress:.2f}%')
+                else:
+                    with tqdm(total=100, position=position, desc=desc) as pbar: # type: ignore
+                        for progress in read_progress(proc.stdout, total): # type: ignore
+                            pbar.update(progress - pbar.n)
+
+            if proc.returncode:
+                print(f'Error: failed to process {desc}')
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        list(executor.map(run_one, groups))
 
 def handle_gui():
     from guizero import App, PushButton, Box, TextBox, Text, Combo, CheckBox
     from tkinter.filedialog import askopenfilenames
     from tkinter.ttk import Progressbar
     from threading import Thread
+    import asyncio
 
-    ff: FfmpegProgress | None = None
+    loop: asyncio.AbstractEventLoop | None = None
+    running: list[asyncio.subprocess.Process] = []
+    cancelled = False
 
     def download_ffmpeg():
         if sys.platform == 'win32':
-            from tempfile import mkdtemp
+            from tempfile import mkdtemp, TemporaryFile
             import requests
             import zipfile
-            import shutil
-            import io
 
             url = 'https://github.com/BtbN/FFmpeg-Builds/releases/download/latest/ffmpeg-master-latest-win64-gpl.zip'
-            response = requests.get(url)
-            with zipfile.ZipFile(io.BytesIO(response.content)) as z:
-                print('Extracting ffmpeg')
-                temp = mkdtemp()
-                bin = 'ffmpeg-master-latest-win64-gpl/bin'
-                z.extractall(temp, [f'{bin}/ffmpeg.exe', f'{bin}/ffprobe.exe'])
-                shutil.move(f'{temp}/{bin}/ffmpeg.exe', 'ffmpeg.exe')
-                shutil.move(f'{temp}/{bin}/ffprobe.exe', 'ffprobe.exe')
-                shutil.rmtree(temp)
+            # spool the archive to disk instead of holding the whole zip in memory
+            with TemporaryFile() as archive:
+                with requests.get(url, stream=True) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        archive.write(chunk)
+
+                with zipfile.ZipFile(archive) as z:
+                    print('Extracting ffmpeg')
+                    temp = mkdtemp()
+                    bin = 'ffmpeg-master-latest-win64-gpl/bin'
+                    z.extractall(temp, [f'{bin}/ffmpeg.exe', f'{bin}/ffprobe.exe'])
+                    shutil.move(f'{temp}/{bin}/ffmpeg.exe', 'ffmpeg.exe')
+                    shutil.move(f'{temp}/{bin}/ffprobe.exe', 'ffprobe.exe')
+                    shutil.rmtree(temp)
+            ensure_ffmpeg.cache_clear()
         else:
             print('Error: unsupported platform')
 
@@ -170,46 +339,112 @@ def handle_gui():
         try:
             probe(file)
             return True
-        except subprocess.CalledProcessError:
+        except (subprocess.CalledProcessError, OSError):
             return False
         
     def td_str(td: timedelta) -> str:
-        return f'{td.seconds//3600:02}:{td.seconds//60%60:02}:{td.seconds%60:02}'
-        
-    def start_work(videos: list[str]):
-        nonlocal ff
+        s = int(td.total_seconds())
+        return f'{s//3600:02}:{s//60%60:02}:{s%60:02}'
         
-        for file in videos:
-            ff_start = datetime.now()
-            progress_text.value = file_name(file)
-            if cmd := process(file, suffix_textbox.value, float(size_textbox.value), float(margin_textbox.value), horizontal_textbox.value, vertical_textbox.value, font_textbox.value, color_textbox.bg, border_textbox.bg, float(opacity_textbox.value), bool(cuda_checkbox.value), int(quality_textbox.value)):
-                try:
-                    ff = FfmpegProgress(cmd)
-                    for progress in ff.run_command_with_progress(popen_kwargs=sp_flags):
-                        time = datetime.now() - ff_start
-                        eta = time * (0 if progress == 0 else (100 - progress) / progress)
-                        progress_info.value = f"[{progress:.2f}%] {td_str(time)} (ETA {td_str(eta)})"
-                        progress_bar['value'] = progress
-                except RuntimeError:
-                    if ff:
-                        app.error("Error", f"Failed to process {file_name(file)}")
-                    break
-                except ValueError: break
-                finally:
-                    ff = None
-        else:
+    async def run_ffmpeg(cmd: list[str], total: float, report: Callable[[float], None]):
+        proc = await asyncio.create_subprocess_exec(*cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, **sp_flags)
+        running.append(proc)
+        if cancelled:
+            # stop() ran while the process was being spawned
+            proc.kill()
+        try:
+            time = 0
+            async for line in proc.stdout: # type: ignore
+                time, progress = parse_progress(line.decode(), time, total)
+                if progress is not None:
+                    report(progress)
+            if await proc.wait():
+                raise RuntimeError(f'ffmpeg exited with code {proc.returncode}')
+        finally:
+            running.remove(proc)
+
+    def stop(kill=False):
+        for proc in running:
+            if kill:
+                proc.kill()
+            elif proc.stdin:
+                # lets ffmpeg finalize the output file
+                proc.stdin.write(b'q')
+
+    def show_progress(files: list[str], progress: float, time: timedelta):
+        eta = time * (0 if progress == 0 else (100 - progress) / progress)
+        progress_text.value = ', '.join(map(file_name, files))
+        progress_info.value = f"[{progress:.2f}%] {td_str(time)} (ETA {td_str(eta)})"
+        progress_bar['value'] = progress
+
+    def finish(failed: list[str], skipped: list[str]):
+        if failed:
+            message = f"Failed to process {', '.join(map(file_name, failed))}"
+            if skipped:
+                message += f"\nSkipped:\n{nl.join(map(file_name, skipped))}"
+            app.error("Error", message)
+        elif not cancelled:
             app.info("Info", "Operation completed")
-        
+
         cancel_button.disable()
         start_button.enable()
         progress_box.hide()
-        
+
+    def run_work(work_loop: asyncio.AbstractEventLoop, work: Coroutine[Any, Any, None]):
+        try:
+            work_loop.run_until_complete(work)
+            work_loop.run_until_complete(work_loop.shutdown_default_executor())
+        finally:
+            work_loop.close()
+
+    async def start_work(videos: list[str], kwargs: dict[str, Any]):
+        nonlocal loop
+
+        # the CPU path has cores to spare for a second encode, NVENC sessions are scarce
+        jobs = asyncio.Semaphore(1 if kwargs['gpu'] else 2)
+        progress = dict.fromkeys(videos, 0.0)
+        active: list[str] = []
+        failed: list[str] = []
+        skipped: list[str] = []
+        work_start = datetime.now()
+
+        def report(file: str, value: float):
+            progress[file] = value
+            if loop:
+                app.tk.after(0, show_progress, list(active), sum(progress.values()) / len(videos), datetime.now() - work_start)
+
+        async def work(file: str):
+            async with jobs:
+                if cancelled or failed:
+                    skipped.append(file)
+                    return
+                active.append(file)
+                try:
+                    cmd = await asyncio.to_thread(process, file, **kwargs)
+                    # stop() only reaches running processes, so re-check before spawning;
+                    # after a failure the encodes already running are left to finish
+                    if cmd and (cancelled or failed):
+                        skipped.append(file)
+                    elif cmd:
+                        await run_ffmpeg(cmd, duration([file]), lambda value: report(file, value))
+                except RuntimeError:
+                    if not cancelled:
+                        failed.append(file)
+                finally:
+                    active.remove(file)
+                    report(file, 100)
+
+        await asyncio.gather(*map(work, videos))
+        if loop:
+            loop = None
+            app.tk.after(0, finish, failed, skipped)
+
     def start():
         if not suffix_textbox.value:
             app.error("Error", "Suffix is empty")
             return
         
-        if not re.match(prefix_re, suffix_textbox.value):
+        if not prefix_re.match(suffix_textbox.value):
             app.error("Error", "Suffix is not alphanumeric")
             return
         
@@ -229,27 +464,35 @@ def handle_gui():
         if not videos:
             app.warn("Warning", "No valid files selected")
         elif app.yesno("Confirmation", f"Process {len(videos)} file{'' if len(videos)==1 else 's'}?\n{nl.join(map(file_name, videos))}"):
+            try:
+                kwargs = dict(suffix=suffix_textbox.value, size=float(size_textbox.value), margin=float(margin_textbox.value), position_x=horizontal_textbox.value, position_y=vertical_textbox.value, font=font_textbox.value, color=color_textbox.bg, border=border_textbox.bg, opacity=float(opacity_textbox.value), gpu=bool(cuda_checkbox.value), quality=int(quality_textbox.value), preset=preset_combo.value if cuda_checkbox.value else None)
+            except ValueError:
+                app.error("Error", "Invalid settings")
+                return
+
             cancel_button.enable()
             start_button.disable()
             progress_box.show()
             progress_bar['value'] = 0
             app.show()
 
-            nonlocal ff
-            if ff:
+            nonlocal cancelled, loop
+            if loop:
                 app.error("Error", "Operation already in progress")
                 return
-            
-            Thread(target=start_work, args=(videos,)).start()
+
+            # the loop exists before the thread starts, so cancel() and when_closed() can always reach it
+            cancelled = False
+            loop = asyncio.new_event_loop()
+            Thread(target=run_work, args=(loop, start_work(videos, kwargs))).start()
         else:
             app.info("Info", "Operation cancelled")
 
     def cancel():
-        nonlocal ff
-        if ff:
-            ff_copy = ff
-            ff = None
-            ff_copy.quit_gracefully()
+        nonlocal cancelled
+        if loop and not cancelled:
+            cancelled = True
+            loop.call_soon_threadsafe(stop)
             app.info("Info", "Operation cancelled")
 
         cancel_button.disable()
@@ -315,8 +558,11 @@ def handle_gui():
         app.info("Info", "FFmpeg downloaded")
 
     def when_closed():
-        if ff:
-            ff.quit()
+        nonlocal loop, cancelled
+        if loop:
+            cancelled = True
+            loop.call_soon_threadsafe(stop, True)
+            loop = None
         app.destroy()
 
     def center(win):
@@ -384,7 +630,10 @@ def handle_gui():
 
     cuda_checkbox = CheckBox(settings_box, text="Use NVIDIA GPU acceleration", grid=[0, 10, 3, 1], align="left", width="fill", command=cuda_check)
 
-    PushButton(settings_box, text="Download ffmpeg (recommended for Windows)", grid=[0, 11, 3, 1], align="left", command=download_button)
+    Text(settings_box, text="GPU preset", grid=[0, 11], align="left")
+    preset_combo = Combo(settings_box, selected='p4', options=[f'p{i}' for i in range(1, 8)], grid=[1, 11], align="left", width="fill")
+
+    PushButton(settings_box, text="Download ffmpeg (recommended for Windows)", grid=[0, 12, 3, 1], align="left", command=download_button)
 
     # TODO: add load/save settings buttons
 
@@ -424,6 +673,9 @@ def main():
     parser.add_argument('-y', '--position-y', help='Vertical position', default='bottom', choices=['top', 'center', 'bottom'])
     parser.add_argument('-q', '--quality', help='Quality', default=72, type=int)
     parser.add_argument('-g', '--gpu', help='Use NVIDIA GPU acceleration', action='store_true')
+    parser.add_argument('-p', '--preset', help='Encoder preset, libx264 names (ultrafast ... veryslow) or p1 ... p7 with --gpu (default: ultrafast, p4 with --gpu)')
+    parser.add_argument('-j', '--jobs', help='Number of files encoded in parallel, including batched ones (default: CPU count, 1 with --gpu)', type=int)
+    parser.add_argument('-B', '--batch', help='Max clips of one recording (name_1.mp4, name_2.mp4, ...) encoded by a single ffmpeg, limited by --jobs', default=1, type=int)
 
     args = parser.parse_args()
     if args.input_files: